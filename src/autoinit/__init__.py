@@ -13,7 +13,6 @@ Node init runs once per node/volume (file marker + lock).
 Readiness state stored in Django cache (Redis).
 
 Related Modules:
-- django-pglock: PostgreSQL advisory locks
 - filelock: File-based locking for node markers
 """
 
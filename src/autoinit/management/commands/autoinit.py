@@ -64,12 +64,13 @@ class Command(BaseCommand):
             self.stdout.write('autoinit: infrastructure phase')
             run_infrastructure_init(run_id=run_id, timeout=timeout)
 
-            # Phase 2: Node
+            # Phase 2: Node (infrastructure init returned, so readiness is known)
             self.stdout.write('autoinit: node phase')
             run_node_init(
                 run_id=run_id,
                 timeout=timeout,
                 fatal_on_error=fatal_on_error,
+                skip_readiness_wait=True,
             )
 
             self.stdout.write(self.style.SUCCESS('autoinit: completed'))
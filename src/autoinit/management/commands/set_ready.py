@@ -53,10 +53,12 @@ class Command(BaseCommand):
             self.stdout.write(f'autoinit readiness (run_id={run_id}): {status}')
 
         elif action == 'set':
-            set_ready(run_id)
-            self.stdout.write(
-                self.style.SUCCESS(f'autoinit readiness SET (run_id={run_id})')
-            )
+            if set_ready(run_id):
+                self.stdout.write(
+                    self.style.SUCCESS(f'autoinit readiness SET (run_id={run_id})')
+                )
+            else:
+                self.stdout.write(f'autoinit readiness already SET (run_id={run_id})')
 
         elif action == 'clear':
             clear_ready(run_id)
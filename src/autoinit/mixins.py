@@ -51,7 +51,8 @@ class AutoInitMixin:
         Key Behaviors:
         - Must be idempotent
         - Non-fatal by default (logged and skipped)
-        - Called in INSTALLED_APPS order
+        - Called in INSTALLED_APPS order, or concurrently with other apps'
+          node hooks when AUTOINIT_PARALLEL_HOOKS is enabled
 
         Override this method in your AppConfig to add node init logic.
         """
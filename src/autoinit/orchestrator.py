@@ -5,44 +5,69 @@ Purpose: Core initialization orchestration with distributed locking and readines
 Key Components:
 - get_run_id: Get or generate deployment run ID
 - is_ready / set_ready: Readiness state in Django cache
+- wait_for_ready / wait_for_any_ready: Block until readiness (backoff polling)
 - run_infrastructure_init: Cluster-wide init with PostgreSQL advisory lock
 - run_node_init: Per-node init with file marker + lock
 
 Architecture:
-Infrastructure init uses django-pglock for PostgreSQL advisory locks.
-Node init uses filelock for file-based locking and markers.
+Infrastructure init uses PostgreSQL advisory locks (non-blocking try-lock with backoff).
+Node init uses fcntl.flock (filelock fallback) for file-based locking and markers.
 Readiness state stored in Django cache (Redis recommended).
 All functions preserve INSTALLED_APPS order when calling hooks.
 
 Related Modules:
 - autoinit.mixins: AutoInitMixin hook interface
-- django-pglock: PostgreSQL advisory locks
-- filelock: File-based locking
+- filelock: File-based locking fallback where fcntl is unavailable
 """
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import logging
 import os
+import random
+import socket
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import pglock
 from django.apps import apps
 from django.conf import settings
 from django.core import management
-from django.db import connection
-from filelock import FileLock, Timeout
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.db import DEFAULT_DB_ALIAS, connection, connections
 
 from autoinit.mixins import AutoInitMixin
 
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to filelock
+    fcntl = None
+
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from django.apps import AppConfig
+    from django.core.cache.backends.base import BaseCache
 
 logger = logging.getLogger(__name__)
 
+# Advisory lock key for infrastructure init (signed bigint, computed once)
+_INFRA_LOCK_KEY = int.from_bytes(
+    hashlib.blake2b(b'autoinit_infrastructure', digest_size=8).digest(), 'big', signed=True
+)
+
+# Readiness TTL (24 hours) - should survive container restarts
+_READINESS_TTL_SEC = 86400
+
+# Number of completed run IDs remembered in the node marker
+_NODE_MARKER_HISTORY = 10
+
 
 class AutoInitError(Exception):
     """Base exception for autoinit errors."""
@@ -78,7 +103,7 @@ def get_run_id() -> str:
     if env_value:
         return env_value
     base = os.getcwd().encode()
-    return 'dev-' + hashlib.md5(base).hexdigest()[:8]
+    return 'dev-' + hashlib.blake2b(base, digest_size=4).hexdigest()
 
 
 def _get_timeout() -> int:
@@ -86,11 +111,75 @@ def _get_timeout() -> int:
     return getattr(settings, 'AUTOINIT_TIMEOUT_SEC', 300)
 
 
+def _get_poll_min() -> float:
+    """Get initial polling backoff delay from settings."""
+    return getattr(settings, 'AUTOINIT_POLL_MIN_SEC', 0.05)
+
+
+def _get_poll_max() -> float:
+    """Get maximum polling backoff delay from settings."""
+    return getattr(settings, 'AUTOINIT_POLL_MAX_SEC', 2.0)
+
+
+def _backoff_delays() -> Iterator[float]:
+    """Yield sleep durations for polling loops using exponential backoff with jitter.
+
+    Purpose: Keep the first retries fast while bounding poll rate during long waits.
+
+    Key Behaviors:
+    - Starts at AUTOINIT_POLL_MIN_SEC and doubles up to AUTOINIT_POLL_MAX_SEC
+    - Each delay is jittered by a random factor in [0.5, 1.5) to spread out contending containers
+    - Settings are validated on call, before the first delay is requested
+
+    Raises:
+        ImproperlyConfigured: If not 0 < AUTOINIT_POLL_MIN_SEC <= AUTOINIT_POLL_MAX_SEC
+    """
+    min_delay = _get_poll_min()
+    max_delay = _get_poll_max()
+    if not 0 < min_delay <= max_delay:
+        raise ImproperlyConfigured(
+            f'AUTOINIT_POLL_MIN_SEC must be > 0 and <= AUTOINIT_POLL_MAX_SEC '
+            f'(got {min_delay} and {max_delay})'
+        )
+
+    def delays() -> Iterator[float]:
+        delay = min_delay
+        while True:
+            yield min(delay * (0.5 + random.random()), max_delay)
+            delay = min(delay * 2, max_delay)
+
+    return delays()
+
+
+def _get_parallel_hooks() -> bool:
+    """Get whether node hooks run in parallel from settings."""
+    return getattr(settings, 'AUTOINIT_PARALLEL_HOOKS', False)
+
+
+def _get_hook_workers() -> int:
+    """Get thread pool size for parallel node hooks from settings."""
+    workers = getattr(settings, 'AUTOINIT_HOOK_WORKERS', 4)
+    if workers < 1:
+        raise ImproperlyConfigured(f'AUTOINIT_HOOK_WORKERS must be >= 1 (got {workers})')
+    return workers
+
+
 def _get_cache_alias() -> str:
     """Get cache alias from settings."""
     return getattr(settings, 'AUTOINIT_CACHE_ALIAS', 'default')
 
 
+def _cache() -> BaseCache:
+    """Get the readiness cache backend.
+
+    Django's caches handler already memoizes one backend instance per thread,
+    which some clients (pylibmc, pymemcache) require; do not share it across threads.
+    """
+    from django.core.cache import caches
+
+    return caches[_get_cache_alias()]
+
+
 def _get_readiness_key_prefix() -> str:
     """Get readiness key prefix from settings."""
     return getattr(settings, 'AUTOINIT_READINESS_KEY_PREFIX', 'autoinit:ready')
@@ -101,12 +190,44 @@ def _get_marker_dir() -> Path:
     return Path(getattr(settings, 'AUTOINIT_MARKER_DIR', '/tmp/autoinit'))
 
 
+@functools.lru_cache(maxsize=1)
+def _ensure_marker_dir() -> Path:
+    """Create marker directory once per process and return it."""
+    marker_dir = _get_marker_dir()
+    marker_dir.mkdir(parents=True, exist_ok=True)
+    return marker_dir
+
+
 def _get_readiness_key(run_id: str) -> str:
     """Build cache key for readiness state."""
     prefix = _get_readiness_key_prefix()
     return f'{prefix}:{run_id}'
 
 
+def _is_ready_value(value: object) -> bool:
+    """Interpret a cached readiness value.
+
+    Purpose: Accept the sentinel however the backend returns it (1, '1', b'1', True).
+
+    Key Behaviors:
+    - Rejects None, empty values and zero in any representation ('0', b'0')
+    """
+    return bool(value) and value not in (b'0', '0')
+
+
+def _local_ready_path(run_id: str) -> Path:
+    """Get path to local file recording observed readiness for given run ID."""
+    return _get_marker_dir() / f'.autoinit_ready_{run_id}'
+
+
+def _file_age(path: Path) -> float | None:
+    """Get age in seconds of a file (by mtime), or None if it does not exist."""
+    try:
+        return time.time() - path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
 def is_ready(run_id: str | None = None) -> bool:
     """Check if infrastructure init is complete for the given run ID.
 
@@ -118,30 +239,43 @@ def is_ready(run_id: str | None = None) -> bool:
     Returns:
         True if infrastructure init completed for this run ID
     """
-    from django.core.cache import caches
-
     run_id = run_id or get_run_id()
-    cache = caches[_get_cache_alias()]
+    cache = _cache()
     key = _get_readiness_key(run_id)
-    return cache.get(key) == 1
+    return _is_ready_value(cache.get(key))
 
 
-def set_ready(run_id: str | None = None) -> None:
+def set_ready(run_id: str | None = None, overwrite: bool = False) -> bool:
     """Mark infrastructure init as complete for the given run ID.
 
     Purpose: Signal to node init that infrastructure is ready.
 
+    Key Behaviors:
+    - Atomic first-writer-wins (cache.add, SET NX on Redis)
+    - Existing readiness state is left untouched unless overwrite is set
+    - overwrite replaces any existing value (including one not treated as ready, e.g. '0')
+
     Args:
         run_id: Deployment run ID (defaults to current run ID)
-    """
-    from django.core.cache import caches
+        overwrite: If True, always write the sentinel (cache.set); use only while
+            holding the infrastructure lock
 
+    Returns:
+        True if readiness was newly set, False if it was already set
+    """
     run_id = run_id or get_run_id()
-    cache = caches[_get_cache_alias()]
+    cache = _cache()
     key = _get_readiness_key(run_id)
-    # Set with long TTL (24 hours) - should survive container restarts
-    cache.set(key, 1, timeout=86400)
-    logger.info('autoinit: set ready', extra={'run_id': run_id})
+    if overwrite:
+        cache.set(key, 1, timeout=_READINESS_TTL_SEC)
+        created = True
+    else:
+        created = cache.add(key, 1, timeout=_READINESS_TTL_SEC)
+    if created:
+        logger.info('autoinit: set ready', extra={'run_id': run_id})
+    else:
+        logger.info('autoinit: already ready', extra={'run_id': run_id})
+    return created
 
 
 def clear_ready(run_id: str | None = None) -> None:
@@ -149,15 +283,19 @@ def clear_ready(run_id: str | None = None) -> None:
 
     Purpose: Reset readiness for testing or manual intervention.
 
+    Key Behaviors:
+    - Deletes the cache key and this node's local ready file
+    - Other nodes' local ready files are not affected; they keep skipping the
+      readiness wait for this run ID until the file expires (readiness TTL)
+
     Args:
         run_id: Deployment run ID (defaults to current run ID)
     """
-    from django.core.cache import caches
-
     run_id = run_id or get_run_id()
-    cache = caches[_get_cache_alias()]
+    cache = _cache()
     key = _get_readiness_key(run_id)
     cache.delete(key)
+    _local_ready_path(run_id).unlink(missing_ok=True)
     logger.info('autoinit: cleared ready', extra={'run_id': run_id})
 
 
@@ -166,6 +304,12 @@ def wait_for_ready(run_id: str | None = None, timeout: int | None = None) -> Non
 
     Purpose: Block until infrastructure is ready before proceeding with node init.
 
+    Key Behaviors:
+    - Returns immediately if a local ready file for this run ID is younger than the
+      readiness TTL (same-node restart)
+    - Otherwise polls the cache, then writes the local ready file
+    - clear_ready on another node does not invalidate this node's local ready file
+
     Args:
         run_id: Deployment run ID (defaults to current run ID)
         timeout: Maximum seconds to wait (defaults to AUTOINIT_TIMEOUT_SEC)
@@ -174,17 +318,92 @@ def wait_for_ready(run_id: str | None = None, timeout: int | None = None) -> Non
         AutoInitTimeoutError: If timeout exceeded waiting for readiness
     """
     run_id = run_id or get_run_id()
+    local_ready_path = _local_ready_path(run_id)
+    age = _file_age(local_ready_path)
+    if age is not None and age < _READINESS_TTL_SEC:
+        return
+
+    wait_for_any_ready([run_id], timeout)
+
+    # Best-effort: a read-only marker dir only costs cache probes on restart
+    try:
+        _ensure_marker_dir()
+        local_ready_path.touch()
+    except OSError:
+        logger.debug('autoinit: could not write local ready file', exc_info=True, extra={'run_id': run_id})
+        return
+    # Remove expired files only; a shared marker dir may serve other live deployments
+    for stale_path in local_ready_path.parent.glob('.autoinit_ready_*'):
+        age = _file_age(stale_path)
+        if age is not None and age >= _READINESS_TTL_SEC:
+            try:
+                stale_path.unlink()
+            except OSError:
+                pass
+
+
+def wait_for_any_ready(run_ids: list[str], timeout: int | None = None) -> str:
+    """Wait for infrastructure init to complete for any of the given run IDs.
+
+    Purpose: Accept readiness of either the old or new deployment (blue/green).
+
+    Key Behaviors:
+    - Polls all readiness keys in one cache.get_many call (MGET on Redis)
+    - Polls with exponential backoff
+    - Candidates are checked in the given order
+
+    Args:
+        run_ids: Candidate deployment run IDs, in order of preference
+        timeout: Maximum seconds to wait (defaults to AUTOINIT_TIMEOUT_SEC)
+
+    Returns:
+        The first run ID found ready
+
+    Raises:
+        ValueError: If run_ids is empty
+        AutoInitTimeoutError: If timeout exceeded waiting for readiness
+    """
+    if not run_ids:
+        raise ValueError('wait_for_any_ready requires at least one run ID')
     timeout = timeout or _get_timeout()
+    cache = _cache()
+    keys = {run_id: _get_readiness_key(run_id) for run_id in run_ids}
     start = time.monotonic()
+    delays = _backoff_delays()
+
+    while True:
+        values = cache.get_many(keys.values())
+        for run_id, key in keys.items():
+            if _is_ready_value(values.get(key)):
+                return run_id
 
-    while not is_ready(run_id):
         elapsed = time.monotonic() - start
         if elapsed > timeout:
             raise AutoInitTimeoutError(
-                f'Timeout waiting for infrastructure readiness (run_id={run_id}, timeout={timeout}s)'
+                f'Timeout waiting for infrastructure readiness (run_id={", ".join(run_ids)}, timeout={timeout}s)'
             )
-        time.sleep(1)
-        logger.debug('autoinit: waiting for ready', extra={'run_id': run_id, 'elapsed': elapsed})
+        time.sleep(next(delays))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('autoinit: waiting for ready', extra={'run_ids': run_ids, 'elapsed': elapsed})
+
+
+@functools.lru_cache(maxsize=1)
+def _get_db_endpoint() -> tuple[str, int] | None:
+    """Get (host, port) of the default PostgreSQL database for TCP probing.
+
+    Purpose: Parse DATABASES once so the wait_for_db probe loop does no settings lookups.
+
+    Returns:
+        (host, port) tuple, or None if the database is not PostgreSQL over a single TCP host
+    """
+    if connection.vendor != 'postgresql':
+        return None
+    db_settings = settings.DATABASES[DEFAULT_DB_ALIAS]
+    host = db_settings.get('HOST') or ''
+    # Empty HOST or a directory means a Unix socket; multiple hosts are left to libpq
+    if not host or host.startswith('/') or ',' in host:
+        return None
+    return host, int(db_settings.get('PORT') or 5432)
 
 
 def wait_for_db(timeout: int | None = None) -> None:
@@ -192,6 +411,11 @@ def wait_for_db(timeout: int | None = None) -> None:
 
     Purpose: Block until database connection is established.
 
+    Key Behaviors:
+    - Tries a full connection first (the database is usually already up)
+    - On failure, for PostgreSQL over TCP, polls the port with a plain socket connect
+    - Then retries the full connection (auth, startup) via ensure_connection
+
     Args:
         timeout: Maximum seconds to wait (defaults to AUTOINIT_TIMEOUT_SEC)
 
@@ -200,35 +424,82 @@ def wait_for_db(timeout: int | None = None) -> None:
     """
     timeout = timeout or _get_timeout()
     start = time.monotonic()
+    delays = _backoff_delays()
 
-    while True:
+    def _connect() -> Exception | None:
         try:
             connection.ensure_connection()
-            logger.info('autoinit: database connection established')
-            return
         except Exception as e:
+            return e
+        logger.info('autoinit: database connection established')
+        return None
+
+    # Fast path - no extra TCP handshake when the database is already up
+    if _connect() is None:
+        return
+
+    endpoint = _get_db_endpoint()
+
+    def _port_open() -> bool:
+        try:
+            with socket.create_connection(endpoint, timeout=0.5):
+                return True
+        except OSError:
+            return False
+
+    if endpoint is not None:
+        while not _port_open():
             elapsed = time.monotonic() - start
             if elapsed > timeout:
                 raise AutoInitTimeoutError(
-                    f'Timeout waiting for database connection (timeout={timeout}s): {e}'
+                    f'Timeout waiting for database port {endpoint[0]}:{endpoint[1]} (timeout={timeout}s)'
                 )
-            logger.debug('autoinit: waiting for database', extra={'elapsed': elapsed, 'error': str(e)})
-            time.sleep(1)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('autoinit: waiting for database port', extra={'elapsed': elapsed, 'endpoint': endpoint})
+            time.sleep(next(delays))
 
+    while (error := _connect()) is not None:
+        elapsed = time.monotonic() - start
+        if elapsed > timeout:
+            raise AutoInitTimeoutError(
+                f'Timeout waiting for database connection (timeout={timeout}s): {error}'
+            )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('autoinit: waiting for database', extra={'elapsed': elapsed, 'error': str(error)})
+        time.sleep(next(delays))
 
-def _get_apps_with_mixin() -> list[AppConfig]:
+
+@functools.lru_cache(maxsize=1)
+def _get_apps_with_mixin() -> tuple[AppConfig, ...]:
     """Get all app configs that implement AutoInitMixin in INSTALLED_APPS order.
 
     Purpose: Discover apps participating in autoinit.
 
+    Key Behaviors:
+    - Cached for the process lifetime (app registry is immutable after setup)
+    - Cache is cleared when INSTALLED_APPS changes (override_settings in tests)
+
     Returns:
-        List of AppConfig instances with AutoInitMixin, in INSTALLED_APPS order
+        Tuple of AppConfig instances with AutoInitMixin, in INSTALLED_APPS order
     """
     result = []
     for app_config in apps.get_app_configs():
         if isinstance(app_config, AutoInitMixin):
             result.append(app_config)
-    return result
+    return tuple(result)
+
+
+def _reset_cached_state(*, setting: str, **kwargs) -> None:
+    """Clear module-level caches when relevant settings change."""
+    if setting == 'INSTALLED_APPS':
+        _get_apps_with_mixin.cache_clear()
+    elif setting == 'AUTOINIT_MARKER_DIR':
+        _ensure_marker_dir.cache_clear()
+    elif setting == 'DATABASES':
+        _get_db_endpoint.cache_clear()
+
+
+setting_changed.connect(_reset_cached_state)
 
 
 def _run_migrations() -> None:
@@ -240,14 +511,190 @@ def _run_migrations() -> None:
     management.call_command('migrate', '--noinput', verbosity=1)
 
 
+def _staticfiles_sources() -> list[tuple[str, str]]:
+    """Get (prefix, path) pairs of directories collectstatic reads from.
+
+    Purpose: Cover STATICFILES_DIRS plus each installed app's static/ directory.
+    """
+    sources = []
+    for entry in getattr(settings, 'STATICFILES_DIRS', []):
+        if isinstance(entry, (list, tuple)):
+            prefix, path = entry
+        else:
+            prefix, path = '', entry
+        sources.append((prefix, os.fspath(path)))
+    for app_config in apps.get_app_configs():
+        sources.append(('', os.path.join(app_config.path, 'static')))
+    return sources
+
+
+def _staticfiles_config() -> tuple:
+    """Get the settings that decide what collectstatic writes.
+
+    Purpose: Changing storage (e.g. to ManifestStaticFilesStorage) or finders must
+    invalidate the fingerprint even if no source file changed.
+    """
+    storage = getattr(settings, 'STORAGES', {}).get('staticfiles', {})
+    try:
+        ignore_patterns = apps.get_app_config('staticfiles').ignore_patterns
+    except LookupError:
+        ignore_patterns = None
+    return (
+        storage.get('BACKEND'),
+        storage.get('OPTIONS', {}),
+        list(getattr(settings, 'STATICFILES_FINDERS', [])),
+        ignore_patterns,
+        getattr(settings, 'STATICFILES_IGNORE_PATTERNS', None),
+    )
+
+
+def _staticfiles_fingerprint() -> bytes:
+    """Compute a cheap digest of static source files.
+
+    Purpose: Detect whether collectstatic would produce different output.
+
+    Key Behaviors:
+    - Hashes the settings that decide collectstatic output: staticfiles storage
+      backend and OPTIONS, STATICFILES_FINDERS and ignore patterns
+    - Hashes (path, st_mtime_ns, st_size) of every file, no file contents
+    - Missing source directories and unreadable entries (dangling symlinks) are skipped
+    - Symlinked directories contribute their target path but are not descended into
+
+    Returns:
+        blake2b digest of the static source tree metadata
+    """
+    digest = hashlib.blake2b()
+
+    def walk(path: str) -> None:
+        try:
+            entries = sorted(os.scandir(path), key=lambda entry: entry.name)
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_symlink() and entry.is_dir():
+                    digest.update(f'{entry.path}\0->{os.readlink(entry.path)}\n'.encode())
+                elif entry.is_dir():
+                    walk(entry.path)
+                else:
+                    st = entry.stat()
+                    digest.update(f'{entry.path}\0{st.st_mtime_ns}\0{st.st_size}\n'.encode())
+            except OSError:
+                digest.update(f'{entry.path}\0?\n'.encode())
+
+    digest.update(f'{_staticfiles_config()!r}\n'.encode())
+    for prefix, path in _staticfiles_sources():
+        digest.update(f'{prefix}\0{path}\n'.encode())
+        walk(path)
+    return digest.digest()
+
+
+def _get_fingerprint_path() -> Path | None:
+    """Get path of the staticfiles fingerprint, or None if fingerprinting does not apply.
+
+    Purpose: Only fingerprint when enabled and collectstatic writes to a local STATIC_ROOT.
+    """
+    if not getattr(settings, 'AUTOINIT_STATIC_FINGERPRINT', False):
+        return None
+    static_root = getattr(settings, 'STATIC_ROOT', None)
+    if not static_root:
+        return None
+
+    from django.core.files.storage import FileSystemStorage, storages
+
+    storage = storages['staticfiles']
+    if not isinstance(storage, FileSystemStorage):
+        return None
+    if os.path.abspath(storage.location) != os.path.abspath(static_root):
+        return None
+    return Path(static_root) / '.staticfiles.fingerprint'
+
+
 def _run_collectstatic() -> None:
     """Run Django collectstatic.
 
     Purpose: Core node step - collect static files.
+
+    Key Behaviors:
+    - With AUTOINIT_STATIC_FINGERPRINT, skipped if STATIC_ROOT/.staticfiles.fingerprint
+      matches the current source fingerprint (local FileSystemStorage only)
+    - Fingerprint is written after a successful run (best-effort)
     """
+    fingerprint_path = _get_fingerprint_path()
+    fingerprint = None
+
+    if fingerprint_path is not None:
+        fingerprint = _staticfiles_fingerprint()
+        try:
+            if fingerprint_path.read_bytes() == fingerprint:
+                logger.info('autoinit: static files unchanged, skipping collectstatic')
+                return
+        except OSError:
+            pass
+
     logger.info('autoinit: running collectstatic')
     management.call_command('collectstatic', '--noinput', verbosity=1)
 
+    if fingerprint_path is not None:
+        try:
+            # STATIC_ROOT may not exist if the project has no static files
+            fingerprint_path.parent.mkdir(parents=True, exist_ok=True)
+            fingerprint_path.write_bytes(fingerprint)
+        except OSError:
+            logger.warning('autoinit: could not write staticfiles fingerprint', exc_info=True)
+
+
+@contextmanager
+def _infrastructure_lock(run_id: str, timeout: int) -> Iterator[bool]:
+    """Acquire the cluster-wide advisory lock for infrastructure init.
+
+    Purpose: Serialize infrastructure init without pinning a pooled connection while waiting.
+
+    Key Behaviors:
+    - Uses a dedicated database connection, closed on exit
+    - Polls pg_try_advisory_lock with exponential backoff instead of blocking
+    - Checks readiness between attempts; yields False if another container completed init
+    - Releases the lock with pg_advisory_unlock on exit
+
+    Args:
+        run_id: Deployment run ID
+        timeout: Lock acquisition timeout in seconds
+
+    Yields:
+        True if the lock is held, False if infrastructure became ready while waiting
+
+    Raises:
+        AutoInitTimeoutError: If lock acquisition times out
+    """
+    lock_connection = connections.create_connection(DEFAULT_DB_ALIAS)
+    try:
+        with lock_connection.cursor() as cursor:
+            start = time.monotonic()
+            delays = _backoff_delays()
+            while True:
+                cursor.execute('SELECT pg_try_advisory_lock(%s)', [_INFRA_LOCK_KEY])
+                if cursor.fetchone()[0]:
+                    break
+                if is_ready(run_id):
+                    yield False
+                    return
+                if time.monotonic() - start > timeout:
+                    raise AutoInitTimeoutError(
+                        f'Lock acquisition timed out (timeout={timeout}s)'
+                    )
+                time.sleep(next(delays))
+
+            try:
+                yield True
+            finally:
+                # Closing the connection below releases session locks anyway
+                try:
+                    cursor.execute('SELECT pg_advisory_unlock(%s)', [_INFRA_LOCK_KEY])
+                except Exception:
+                    logger.warning('autoinit: advisory lock release failed', exc_info=True, extra={'run_id': run_id})
+    finally:
+        lock_connection.close()
+
 
 def run_infrastructure_init(run_id: str | None = None, timeout: int | None = None) -> None:
     """Execute infrastructure initialization with distributed lock.
@@ -255,6 +702,7 @@ def run_infrastructure_init(run_id: str | None = None, timeout: int | None = Non
     Purpose: Run cluster-wide init steps exactly once per deployment.
 
     Key Behaviors:
+    - Returns early if cache already shows ready (no database connect)
     - Waits for database connectivity
     - Acquires PostgreSQL advisory lock
     - Runs migrations
@@ -277,77 +725,266 @@ def run_infrastructure_init(run_id: str | None = None, timeout: int | None = Non
 
     logger.info('autoinit: starting infrastructure init', extra={'run_id': run_id})
 
-    # Wait for database
-    wait_for_db(timeout)
-
-    # Check if already ready (another container completed init)
-    if is_ready(run_id):
+    # Fast path - avoid DB connect if cache already shows ready
+    try:
+        ready = is_ready(run_id)
+    except Exception:
+        logger.warning('autoinit: readiness check failed, waiting for database', exc_info=True, extra={'run_id': run_id})
+        ready = False
+    if ready:
         logger.info('autoinit: infrastructure already ready', extra={'run_id': run_id})
         return
 
-    # Acquire distributed lock using django-pglock
-    with pglock.advisory('autoinit_infrastructure', timeout=timeout) as acquired:
+    # Wait for database
+    wait_for_db(timeout)
+
+    # Acquire distributed lock (dedicated connection, non-blocking retries)
+    with _infrastructure_lock(run_id, timeout) as acquired:
         if not acquired:
-            raise AutoInitTimeoutError(
-                f'Lock acquisition timed out (timeout={timeout}s)'
-            )
+            logger.info('autoinit: infrastructure ready (observed while waiting for lock)', extra={'run_id': run_id})
+            return
 
         # Double-check readiness inside lock (another process may have completed)
         if is_ready(run_id):
             logger.info('autoinit: infrastructure ready (checked inside lock)', extra={'run_id': run_id})
             return
 
+        # Hook progress, reported if init fails
+        current_app: str | None = None
+        timings: dict[str, float] = {}
+
         try:
             # Core infrastructure: migrations
             _run_migrations()
 
             # App hooks in INSTALLED_APPS order
             for app_config in _get_apps_with_mixin():
-                logger.info(
-                    'autoinit: running infrastructure hook',
-                    extra={'app': app_config.name},
-                )
+                current_app = app_config.name
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug('autoinit: running infrastructure hook', extra={'run_id': run_id, 'app': current_app})
+                t = time.monotonic()
                 app_config.handle_infrastructure_init()
+                timings[current_app] = time.monotonic() - t
+            current_app = None
+            logger.info('autoinit: phase complete', extra={'run_id': run_id, 'phase': 'infra', 'timings': timings})
 
-            # Mark as ready
-            set_ready(run_id)
+            # Mark as ready (overwrite: readiness was re-checked inside the lock, and a
+            # leftover non-ready value such as '0' would make cache.add fail silently)
+            set_ready(run_id, overwrite=True)
             logger.info('autoinit: infrastructure init completed', extra={'run_id': run_id})
 
         except Exception as e:
-            logger.exception('autoinit: infrastructure init failed', extra={'run_id': run_id})
+            logger.exception(
+                'autoinit: infrastructure init failed',
+                extra={'run_id': run_id, 'app': current_app, 'timings': timings},
+            )
             raise AutoInitInfrastructureError(f'Infrastructure init failed: {e}') from e
 
 
-def _get_node_marker_path(run_id: str) -> Path:
-    """Get path to node marker file for given run ID."""
+def _run_node_hooks(run_id: str, fatal_on_error: bool, workers: int | None) -> None:
+    """Call handle_node_init on all apps with AutoInitMixin.
+
+    Purpose: Run node hooks serially or, if AUTOINIT_PARALLEL_HOOKS is set, in a thread pool.
+
+    Key Behaviors:
+    - Serial mode calls hooks in INSTALLED_APPS order
+    - Parallel mode submits all hooks to AUTOINIT_HOOK_WORKERS threads (no ordering guarantee)
+    - Hook errors are logged and skipped unless fatal_on_error is set
+    - Logs one summary record with per-app timings (per-app start records at DEBUG only)
+
+    Args:
+        run_id: Deployment run ID (for logging)
+        fatal_on_error: If True, re-raise the first hook error; otherwise log and continue
+        workers: Thread pool size for parallel mode, or None to run serially
+    """
+    timings: dict[str, float] = {}
+
+    def run_hook(app_config: AppConfig) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('autoinit: running node hook', extra={'run_id': run_id, 'app': app_config.name})
+        t = time.monotonic()
+        try:
+            app_config.handle_node_init()
+        finally:
+            timings[app_config.name] = time.monotonic() - t
+
+    def run_pooled_hook(app_config: AppConfig) -> None:
+        try:
+            run_hook(app_config)
+        finally:
+            # DB connections are per-thread; close any the hook opened in this worker.
+            # A close failure must not replace the hook's own exception.
+            try:
+                connections.close_all()
+            except Exception:
+                logger.debug('autoinit: closing hook thread connections failed', exc_info=True)
+
+    def handle_error(app_config: AppConfig, e: Exception) -> None:
+        if fatal_on_error:
+            raise e
+        logger.warning(
+            'autoinit: node hook failed (non-fatal)',
+            extra={'run_id': run_id, 'app': app_config.name, 'error': str(e)},
+        )
+
+    app_configs = _get_apps_with_mixin()
+
+    if workers is not None:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run_pooled_hook, app_config): app_config for app_config in app_configs}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    if fatal_on_error:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                    handle_error(futures[future], e)
+    else:
+        for app_config in app_configs:
+            try:
+                run_hook(app_config)
+            except Exception as e:
+                handle_error(app_config, e)
+
+    logger.info('autoinit: phase complete', extra={'run_id': run_id, 'phase': 'node', 'timings': timings})
+
+
+def _get_node_marker_path() -> Path:
+    """Get path to node marker file (holds recently completed run IDs)."""
     marker_dir = _get_marker_dir()
-    return marker_dir / f'.autoinit_node_{run_id}.marker'
+    return marker_dir / '.autoinit_node.marker'
+
+
+def _read_node_marker() -> list[str]:
+    """Read run IDs recorded in the node marker, oldest first."""
+    marker_path = _get_node_marker_path()
+    try:
+        return marker_path.read_text().splitlines()
+    except FileNotFoundError:
+        return []
 
 
 def _check_node_marker(run_id: str) -> bool:
-    """Check if node init marker exists for given run ID."""
-    marker_path = _get_node_marker_path(run_id)
-    return marker_path.exists()
+    """Check if node init marker records the given run ID."""
+    return run_id in _read_node_marker()
 
 
 def _create_node_marker(run_id: str) -> None:
-    """Create node init marker for given run ID."""
-    marker_path = _get_node_marker_path(run_id)
-    marker_path.parent.mkdir(parents=True, exist_ok=True)
-    marker_path.touch()
+    """Record the given run ID as completed in the node init marker.
+
+    Purpose: Keep a single marker file regardless of deployment history.
+
+    Key Behaviors:
+    - Appends run_id and keeps the last _NODE_MARKER_HISTORY run IDs, so old and new
+      deployments sharing a volume (rolling, blue/green) do not re-run each other's init
+    - Writes to a temporary file and os.replace()s it over the marker (atomic)
+    - Best-effort removal of legacy per-run-ID marker and lock files older than the readiness TTL
+
+    Must be called under the node lock (read-modify-write).
+    """
+    marker_dir = _ensure_marker_dir()
+    marker_path = _get_node_marker_path()
+
+    run_ids = [r for r in _read_node_marker() if r != run_id]
+    run_ids.append(run_id)
+    run_ids = run_ids[-_NODE_MARKER_HISTORY:]
+
+    with tempfile.NamedTemporaryFile('w', dir=marker_dir, prefix='.autoinit_node.', delete=False) as f:
+        f.write('\n'.join(run_ids) + '\n')
+    os.replace(f.name, marker_path)
+
+    # Remove expired files only; old-version pods on a shared volume may still
+    # check their per-run-ID marker or hold its lock during an upgrade rollout
+    for legacy_path in marker_dir.glob('.autoinit_node_*'):
+        age = _file_age(legacy_path)
+        if age is not None and age >= _READINESS_TTL_SEC:
+            try:
+                legacy_path.unlink()
+            except OSError:
+                pass
+
+
+@contextmanager
+def _flock(path: Path, timeout: int) -> Iterator[None]:
+    """Hold an exclusive fcntl.flock on path.
+
+    Purpose: Single-host node lock using one file descriptor for the whole wait.
+
+    Key Behaviors:
+    - Retries LOCK_EX | LOCK_NB with exponential backoff until timeout
+    - Unlocks and closes the descriptor on exit
+
+    Raises:
+        AutoInitTimeoutError: If lock acquisition times out
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        start = time.monotonic()
+        delays = _backoff_delays()
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() - start > timeout:
+                    raise AutoInitTimeoutError(
+                        f'File lock acquisition timed out (timeout={timeout}s)'
+                    ) from None
+                time.sleep(next(delays))
+
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def _node_lock(path: Path, timeout: int) -> Iterator[None]:
+    """Hold the node init file lock.
+
+    Purpose: Serialize node init between processes sharing the marker directory.
+
+    Key Behaviors:
+    - Uses fcntl.flock where available (Linux/macOS)
+    - Falls back to filelock on platforms without fcntl
+
+    Raises:
+        AutoInitTimeoutError: If lock acquisition times out
+    """
+    if fcntl is not None:
+        with _flock(path, timeout):
+            yield
+        return
+
+    from filelock import FileLock, Timeout
+
+    try:
+        lock = FileLock(path, timeout=timeout)
+        lock.acquire()
+    except Timeout:
+        raise AutoInitTimeoutError(
+            f'File lock acquisition timed out (timeout={timeout}s)'
+        )
+    try:
+        yield
+    finally:
+        lock.release()
 
 
 def run_node_init(
     run_id: str | None = None,
     timeout: int | None = None,
     fatal_on_error: bool = False,
+    skip_readiness_wait: bool = False,
 ) -> None:
     """Execute node initialization with marker + file lock.
 
     Purpose: Run per-node/per-volume init steps idempotently.
 
     Key Behaviors:
-    - Waits for infrastructure readiness
+    - Waits for infrastructure readiness (unless skip_readiness_wait)
     - Checks marker file (skips if already done for this run ID)
     - Acquires file lock for marker operations
     - Runs collectstatic
@@ -358,22 +995,27 @@ def run_node_init(
         run_id: Deployment run ID (defaults to current run ID)
         timeout: Lock/wait timeout (defaults to AUTOINIT_TIMEOUT_SEC)
         fatal_on_error: If True, raise on hook errors; otherwise log and continue
+        skip_readiness_wait: If True, do not wait for readiness (caller just completed infrastructure init)
 
     Raises:
         AutoInitTimeoutError: If readiness wait or lock acquisition times out
+        ImproperlyConfigured: If AUTOINIT_HOOK_WORKERS is invalid
 
     Related:
     - management/commands/autoinit_node.py: Management command wrapper
     """
     run_id = run_id or get_run_id()
     timeout = timeout or _get_timeout()
+    # Validate hook settings before doing any work
+    hook_workers = _get_hook_workers() if _get_parallel_hooks() else None
 
     logger.info('autoinit: starting node init', extra={'run_id': run_id})
 
     # Wait for infrastructure readiness
-    logger.info('autoinit: waiting for infrastructure readiness', extra={'run_id': run_id})
-    wait_for_ready(run_id, timeout)
-    logger.info('autoinit: infrastructure ready, proceeding', extra={'run_id': run_id})
+    if not skip_readiness_wait:
+        logger.info('autoinit: waiting for infrastructure readiness', extra={'run_id': run_id})
+        wait_for_ready(run_id, timeout)
+        logger.info('autoinit: infrastructure ready, proceeding', extra={'run_id': run_id})
 
     # Check marker (fast path - already done)
     if _check_node_marker(run_id):
@@ -381,41 +1023,22 @@ def run_node_init(
         return
 
     # File lock for marker operations
-    marker_path = _get_node_marker_path(run_id)
+    marker_path = _get_node_marker_path()
     lock_path = marker_path.with_suffix('.lock')
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_marker_dir()
 
-    try:
-        with FileLock(lock_path, timeout=timeout):
-            # Double-check marker inside lock
-            if _check_node_marker(run_id):
-                logger.info('autoinit: node init done (checked inside lock)', extra={'run_id': run_id})
-                return
+    with _node_lock(lock_path, timeout):
+        # Double-check marker inside lock
+        if _check_node_marker(run_id):
+            logger.info('autoinit: node init done (checked inside lock)', extra={'run_id': run_id})
+            return
 
-            # Core node step: collectstatic
-            _run_collectstatic()
+        # Core node step: collectstatic
+        _run_collectstatic()
 
-            # App hooks in INSTALLED_APPS order
-            for app_config in _get_apps_with_mixin():
-                logger.info(
-                    'autoinit: running node hook',
-                    extra={'app': app_config.name},
-                )
-                try:
-                    app_config.handle_node_init()
-                except Exception as e:
-                    if fatal_on_error:
-                        raise
-                    logger.warning(
-                        'autoinit: node hook failed (non-fatal)',
-                        extra={'app': app_config.name, 'error': str(e)},
-                    )
+        # App hooks (INSTALLED_APPS order unless AUTOINIT_PARALLEL_HOOKS)
+        _run_node_hooks(run_id, fatal_on_error, hook_workers)
 
-            # Create marker
-            _create_node_marker(run_id)
-            logger.info('autoinit: node init completed', extra={'run_id': run_id})
-
-    except Timeout:
-        raise AutoInitTimeoutError(
-            f'File lock acquisition timed out (timeout={timeout}s)'
-        )
+        # Create marker
+        _create_node_marker(run_id)
+        logger.info('autoinit: node init completed', extra={'run_id': run_id})